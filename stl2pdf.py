@@ -5,7 +5,7 @@
 # Copyright © 2011-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2011-10-02T18:07:38+02:00
-# Last modified: 2020-10-04T18:26:53+0200
+# Last modified: 2026-10-16T19:15:22+0200
 """
 Program for converting a view of an STL file into a PDF file.
 
@@ -18,7 +18,6 @@ picture.
 """
 
 import argparse
-import cairo
 import logging
 import sys
 from stltools import stl, bbox, utils, vecops, matrix, __version__
@@ -88,7 +87,7 @@ def main(argv):
         "-z",
         type=float,
         action=utils.RotateAction,
-        help="rotation around X axis in degrees",
+        help="rotation around Z axis in degrees",
     )
     parser.add_argument("-v", "--version", action="version", version=__version__)
     parser.add_argument("file", nargs=1, type=str, help="name of the file to process")
@@ -97,6 +96,9 @@ def main(argv):
         level=getattr(logging, args.log.upper(), None),
         format="%(levelname)s: %(message)s",
     )
+    # Imported here so that --help and --version work without loading cairo.
+    import cairo
+
     args.file = args.file[0]
     args.fg = int(args.fg, 16)
     f_red, f_green, f_blue = utils.num2rgb(args.fg)
@@ -123,8 +125,8 @@ def main(argv):
         logging.error(f"{args.file}: {e}")
         sys.exit(1)
     logging.info("calculating normal vectors")
-    facets = list(utils.chunked(vertices, 3))
-    normals = [vecops.normal(a, b, c) for a, b, c in facets]
+    facets = list(utils.grouped(vertices, 3))
+    normals = vecops.normals(facets)
     logging.info("applying transformations to world coordinates")
     vertices = vecops.xform(tr, vertices)
     normals = vecops.xform(tr, normals)
@@ -142,7 +144,7 @@ def main(argv):
     mv = matrix.concat(m, v)
     logging.info("transforming to view space")
     vertices = vecops.xform(mv, vertices)
-    facets = list(utils.chunked(vertices, 3))
+    facets = list(utils.grouped(vertices, 3))
     # In the ortho projection on the z=0 plane, z+ is _towards_ the viewer
     logging.info("Determining visible facets")
     vf = [(f, n, 0.4 * n[2] + 0.5) for f, n in zip(facets, normals) if n[2] > 0]
@@ -5,7 +5,7 @@
 # Copyright © 2011-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2011-04-10T18:33:02+02:00
-# Last modified: 2020-10-04T16:59:23+0200
+# Last modified: 2026-10-16T19:15:22+0200
 """Program for converting an STL file into a POV-ray mesh or mesh2."""
 
 import argparse
@@ -77,8 +77,6 @@ def mesh1(name, vertices):
     Returns:
         A string representation of a POV-ray mesh object.
     """
-    numbers = [n for p in vertices for n in p]
-    facets = utils.chunked(numbers, 9)
     uname = name.replace(" ", "_")
     lines = [f"# declare m_{uname} = mesh {{"]
     # The indices sequence 0, 2, 1 is used because of the difference between
@@ -87,7 +85,7 @@ def mesh1(name, vertices):
         "  triangle {{\n    <{0}, {2}, {1}>,\n    <{3}, {5}, {4}>,\n"
         "    <{6}, {8}, {7}>\n  }}"
     )
-    lines += [fct.format(*f) for f in facets]
+    lines += [fct.format(*a, *b, *c) for a, b, c in utils.grouped(vertices, 3)]
     lines += ["}"]
     return "\n".join(lines)
 
@@ -153,7 +151,8 @@ def main(argv):
     if not args.file:
         parser.print_help()
         sys.exit(0)
-    for fn in args.file:
+    # Process every file only once, even if given more than once.
+    for fn in dict.fromkeys(args.file):
         logging.info(f'Starting file "{fn}"')
         if not fn.lower().endswith(".stl"):
             w = f'the file "{fn}" is probably not an STL file, skipping'
@@ -5,7 +5,7 @@
 # Copyright © 2011-2020 R.F. Smith <rsmith@xs4all.nl>.
 # SPDX-License-Identifier: MIT
 # Created: 2011-04-11T01:41:59+02:00
-# Last modified: 2020-10-04T17:42:36+0200
+# Last modified: 2026-10-16T19:15:22+0200
 """
 Program for converting a view of an STL file into a PostScript file.
 
@@ -124,9 +124,8 @@ def main(argv):
         sys.exit(1)
     origbb = bbox.makebb(vertices)
     logging.info("calculating normal vectors")
-    facets = list(utils.chunked(vertices, 3))
-    # facets = list(utils.chunked(utils.chunked(vertices, 3), 3))
-    normals = [vecops.normal(a, b, c) for a, b, c in facets]
+    facets = list(utils.grouped(vertices, 3))
+    normals = vecops.normals(facets)
     logging.info("applying transformations to world coordinates")
     vertices = vecops.xform(tr, vertices)
     normals = vecops.xform(tr, normals)
@@ -144,7 +143,7 @@ def main(argv):
     mv = matrix.concat(m, v)
     logging.info("transforming to view space")
     vertices = vecops.xform(mv, vertices)
-    facets = list(utils.chunked(vertices, 3))
+    facets = list(utils.grouped(vertices, 3))
     # In the ortho projection on the z=0 plane, z+ is _towards_ the viewer
     logging.info("determine visible facets")
     vf = [(f, n, 0.4 * n[2] + 0.5) for f, n in zip(facets, normals) if n[2] > 0]
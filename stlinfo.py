@@ -5,7 +5,7 @@
 # Copyright © 2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2011-12-22T16:48:45+01:00
-# Last modified: 2020-10-04T16:18:51+0200
+# Last modified: 2026-10-16T15:02:33+0200
 """
 Read an STL file and print information about the object.
 
@@ -63,7 +63,8 @@ def main(argv):
     if not args.file:
         parser.print_help()
         sys.exit(0)
-    for fn in args.file:
+    # Process every file only once, even if given more than once.
+    for fn in dict.fromkeys(args.file):
         if not fn.lower().endswith(".stl"):
             w = f'The file "{fn}" is probably not an STL file, skipping.'
             logging.warning(w)
@@ -93,7 +94,7 @@ def main(argv):
             on = utils.outname(fn, ".stl", "_bin")
             print(f'# Writing binary represtation to "{on}".')
             with open(on, "w+b") as of:
-                of.write(stl.binary(name, facets, points, normals, vectors))
+                stl.binary(name, facets, points, normals, vectors, out=of)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,14 @@
 # Copyright © 2013-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2013-07-28 02:07:00 +0200
-# Last modified: 2020-10-04T12:14:34+0200
+# Last modified: 2026-10-16T19:34:15+0200
 """
 3D homogeneous coordinates matrix functions.
 
 For a right-handed coordinate system.
 """
 
+import functools as ft
 import math
 import stltools.vecops as vo
 
@@ -46,70 +47,60 @@ def mul(*args):
     """
     Return the multiplication of the 4x4 matrix arguments.
 
+    Transforming points once with the product is much cheaper than
+    transforming them with each matrix in turn.
+
     Arguments:
-        args: 4x4 numpy arrayis of float32 A, B, C, ..., N.
+        args: 4x4 row-major matrices A, B, C, ..., N.
 
     Returns:
         A × B × C × ... × N
     """
+    return ft.reduce(dot, args)
 
 
 def dot(a, b):
     """Returns the product of the two row-major matrices a and b."""
-    rv = I()
-    # first row
-    rv[0][0] = (
-        a[0][0] * b[0][0] + a[0][1] * b[1][0] + a[0][2] * b[2][0] + a[0][3] * b[3][0]
-    )
-    rv[0][1] = (
-        a[0][0] * b[0][1] + a[0][1] * b[1][1] + a[0][2] * b[2][1] + a[0][3] * b[3][1]
-    )
-    rv[0][2] = (
-        a[0][0] * b[0][2] + a[0][1] * b[1][2] + a[0][2] * b[2][2] + a[0][3] * b[3][2]
-    )
-    rv[0][3] = (
-        a[0][0] * b[0][3] + a[0][1] * b[1][3] + a[0][2] * b[2][3] + a[0][3] * b[3][3]
-    )
-    # second row
-    rv[1][0] = (
-        a[1][0] * b[0][0] + a[1][1] * b[1][0] + a[1][2] * b[2][0] + a[1][3] * b[3][0]
-    )
-    rv[1][1] = (
-        a[1][0] * b[0][1] + a[1][1] * b[1][1] + a[1][2] * b[2][1] + a[1][3] * b[3][1]
-    )
-    rv[1][2] = (
-        a[1][0] * b[0][2] + a[1][1] * b[1][2] + a[1][2] * b[2][2] + a[1][3] * b[3][2]
-    )
-    rv[1][3] = (
-        a[1][0] * b[0][3] + a[1][1] * b[1][3] + a[1][2] * b[2][3] + a[1][3] * b[3][3]
-    )
-    # third row
-    rv[2][0] = (
-        a[2][0] * b[0][0] + a[2][1] * b[1][0] + a[2][2] * b[2][0] + a[2][3] * b[3][0]
-    )
-    rv[2][1] = (
-        a[2][0] * b[0][1] + a[2][1] * b[1][1] + a[2][2] * b[2][1] + a[2][3] * b[3][1]
-    )
-    rv[2][2] = (
-        a[2][0] * b[0][2] + a[2][1] * b[1][2] + a[2][2] * b[2][2] + a[2][3] * b[3][2]
-    )
-    rv[2][3] = (
-        a[2][0] * b[0][3] + a[2][1] * b[1][3] + a[2][2] * b[2][3] + a[2][3] * b[3][3]
-    )
-    # fourth row
-    rv[3][0] = (
-        a[3][0] * b[0][0] + a[3][1] * b[1][0] + a[3][2] * b[2][0] + a[3][3] * b[3][0]
-    )
-    rv[3][1] = (
-        a[3][0] * b[0][1] + a[3][1] * b[1][1] + a[3][2] * b[2][1] + a[3][3] * b[3][1]
-    )
-    rv[3][2] = (
-        a[3][0] * b[0][2] + a[3][1] * b[1][2] + a[3][2] * b[2][2] + a[3][3] * b[3][2]
-    )
-    rv[3][3] = (
-        a[3][0] * b[0][3] + a[3][1] * b[1][3] + a[3][2] * b[2][3] + a[3][3] * b[3][3]
-    )
-    return rv
+    # Unpacking the matrices into local variables saves two subscriptions for
+    # every use of an element.
+    (
+        (a00, a01, a02, a03),
+        (a10, a11, a12, a13),
+        (a20, a21, a22, a23),
+        (a30, a31, a32, a33),
+    ) = a
+    (
+        (b00, b01, b02, b03),
+        (b10, b11, b12, b13),
+        (b20, b21, b22, b23),
+        (b30, b31, b32, b33),
+    ) = b
+    return [
+        [
+            a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+        ],
+        [
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+        ],
+        [
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+        ],
+        [
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+        ],
+    ]
 
 
 def concat(*args):
@@ -4,15 +4,22 @@
 # Copyright © 2012-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2012-11-10 07:55:54 +0100
-# Last modified: 2020-10-04T16:51:54+0200
+# Last modified: 2026-10-16T20:10:04+0200
 """Handling STL files and brep datasets."""
 
 from . import vecops as vo
-from .utils import chunked
+from .utils import grouped
 import datetime
 import mmap
 import struct
 
+# Binary STL file header; 80 bytes of text and the number of facets.
+_HEADER = struct.Struct("<80sI")
+# Binary STL facet; normal vector, three vertices and the attribute count.
+_FACET = struct.Struct("<12fH")
+# The same, skipping the normal vector and attribute count.
+_FACET_VERTICES = struct.Struct("<12x9f2x")
+
 
 def readstl(name, encoding="utf-8"):
     """
@@ -31,9 +38,9 @@ def readstl(name, encoding="utf-8"):
     """
     with open(name, "rb") as f:
         mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
-        vertices, name = _parsebinary(mm, encoding)
-        if vertices is None:
-            mm.seek(0)
+        if _isbinary(mm):
+            vertices, name = _parsebinary(mm, encoding)
+        else:
             vertices, name = _parsetxt(mm, encoding)
         mm.close()
     if vertices is None:
@@ -41,6 +48,29 @@ def readstl(name, encoding="utf-8"):
     return vertices, name
 
 
+def _isbinary(m):
+    """
+    Determine if a file contains a binary STL file.
+
+    A file is binary if its size matches the number of facets in the header.
+    Since not all programs get that right, a file that is large enough and
+    doesn't have the text "facet normal" in the first 84 bytes is also
+    regarded as binary.
+
+    Arguments:
+        m: A memory mapped file.
+
+    Returns:
+        True if the file is binary, False otherwise.
+    """
+    if len(m) < _HEADER.size:
+        return False
+    _, count = _HEADER.unpack_from(m)
+    if len(m) == _HEADER.size + count * _FACET.size:
+        return True
+    return m.find(b"facet normal", 0, _HEADER.size) == -1
+
+
 def _parsebinary(m, encoding):
     """
     Parse a binary STL file.
@@ -53,12 +83,8 @@ def _parsebinary(m, encoding):
         The vertices as a list of 3-tuples, and the name of the object from
         the file.
     """
-    data = m.read(84)
-    name = ""
-    points = None
-    if b"facet normal" in data:
-        return None, None
-    name, _ = struct.unpack("<80sI", data[0:84])
+    data = m.read(_HEADER.size)
+    name, _ = _HEADER.unpack(data)
     if b"COLOR" in data:
         date = datetime.datetime.now()
         name = b" ".join(
@@ -75,28 +101,34 @@ def _parsebinary(m, encoding):
     name = name.decode(encoding)
     name = name.replace("solid ", "")
     name = name.strip("\x00 \t\n\r")
-    points = [p for p in _getbp(m)]
+    points = _getbp(m)
     return points, name
 
 
 def _getbp(m):
     """
-    Generate points from a binary STL file.
+    Read the points from a binary STL file.
 
     Arguments:
         m: A memory mapped file.
 
-    Yields:
-        The vertices as 3-tuple of floats.
+    Returns:
+        The vertices as a list of 3-tuples of floats.
     """
-    while True:
-        v = m.read(50)
-        if len(v) != 50:
-            break
-        p = struct.unpack("<12x9f2x", v)
-        yield tuple(p[0:3])
-        yield tuple(p[3:6])
-        yield tuple(p[6:])
+    start = m.tell()
+    count = (len(m) - start) // _FACET.size
+    # The number of vertices is known, so the list is allocated up front.
+    points = [None] * (3 * count)
+    # Unpack straight from the memory map instead of copying the data first.
+    # The views must be released before the memory map can be closed.
+    with memoryview(m) as mv, mv[start:start + count * _FACET.size] as data:
+        i = 0
+        for ax, ay, az, bx, by, bz, cx, cy, cz in _FACET_VERTICES.iter_unpack(data):
+            points[i] = (ax, ay, az)
+            points[i + 1] = (bx, by, bz)
+            points[i + 2] = (cx, cy, cz)
+            i += 3
+    return points
 
 
 def _parsetxt(m, encoding):
@@ -119,30 +151,14 @@ def _parsetxt(m, encoding):
             name = first.strip().split(None, 1)[1]
         except IndexError:
             name = ""
-        vlines = [ln.split() for ln in _striplines(m) if ln.startswith("vertex")]
-        points = [tuple(float(k) for k in j[1:]) for j in vlines]
-    m.seek(0)
+        # Splitting the remainder of the file in one go and keeping the lines
+        # as bytes is much faster than reading and decoding line by line.
+        lines = m[m.tell():].splitlines()
+        vlines = [ln.split() for ln in lines if ln.lstrip().startswith(b"vertex")]
+        points = [(float(x), float(y), float(z)) for _, x, y, z in vlines]
     return points, name
 
 
-def _striplines(m):
-    """
-    Generate stripped lines from a memmapped text file.
-
-    Arguments:
-        m: A memory mapped file.
-
-    Yields:
-        The stripped lines of the file as text.
-    """
-    while True:
-        v = m.readline().decode("utf-8")
-        if v:
-            yield v.strip()
-        else:
-            break
-
-
 def toindexed(vertices):
     """
     Convert vertices to index format.
@@ -154,10 +170,11 @@ def toindexed(vertices):
         vertices: (?, 3) array of vertex coordinates.
 
     Returns:
-        An (?, 3) array of facet indices and an (M, 3) array of unique points.
+        A tuple of 3-tuples of facet indices and a tuple of unique 3-tuple
+        points.
     """
     ix, points = vo.indexate(vertices)
-    facets = list(chunked(ix, 3))
+    facets = tuple(grouped(ix, 3))
     return facets, points
 
 
@@ -173,7 +190,7 @@ def normals(facets, points):
         an array of normal vector indices for each facet and an array of
         unique normals.
     """
-    nv = [vo.normal(points[i], points[j], points[k]) for i, j, k in facets]
+    nv = vo.normals((points[i], points[j], points[k]) for i, j, k in facets)
     return vo.indexate(nv)
 
 
@@ -191,24 +208,25 @@ def text(name, ifacets, points, inormals, vectors):
     Returns:
         A string containing a text representation of the brep.
     """
-    fcts = list(zip(ifacets, inormals))
-    ln = ["solid {}".format(name)]
-    for f, n in fcts:
-        ln.append(
-            f"  facet normal {vectors[n][0]:.1f} {vectors[n][1]:.1f} {vectors[n][2]:.1f}"
-        )
-        ln.append("    outer loop")
-        for v in f:
-            ln.append(
-                f"      vertex {points[v][0]:.1f} {points[v][1]:.1f} {points[v][2]:.1f}"
-            )
-        ln.append("    endloop")
-        ln.append("  endfacet")
+    # Formatting a whole facet with a single format call is much faster than
+    # formatting each line separately. See doc/optimizations.rst.
+    fct = (
+        "  facet normal {:.1f} {:.1f} {:.1f}\n    outer loop\n"
+        "      vertex {:.1f} {:.1f} {:.1f}\n"
+        "      vertex {:.1f} {:.1f} {:.1f}\n"
+        "      vertex {:.1f} {:.1f} {:.1f}\n"
+        "    endloop\n  endfacet"
+    )
+    ln = [f"solid {name}"]
+    ln += [
+        fct.format(*vectors[n], *points[a], *points[b], *points[c])
+        for (a, b, c), n in zip(ifacets, inormals)
+    ]
     ln.append("endsolid")
     return "\n".join(ln)
 
 
-def binary(name, ifacets, points, inormals, vectors):
+def binary(name, ifacets, points, inormals, vectors, out=None):
     """
     Make an STL binary representation of a brep.
 
@@ -218,17 +236,22 @@ def binary(name, ifacets, points, inormals, vectors):
         points: An (?, 3) array of vertex coordinates.
         inormals: An array of indices into the vectors list.
         vectors: An (?, 3) array of normal vectors.
+        out: Optional binary file object to write the representation to.
 
     Returns:
-        A string containing a binary representation of the brep.
+        A bytes object containing a binary representation of the brep, or
+        None if it was written to out.
     """
-    rc = [struct.pack("<80sI", name.encode("utf-8"), len(ifacets))]
-    for fi, ni in zip(ifacets, inormals):
-        # data = list(np.concatenate((vectors[ni], points[fi[0]], points[fi[1]], points[fi[2]]))
-        #             ) + [0]
-        data = list(vectors[ni] + points[fi[0]] + points[fi[1]] + points[fi[2]]) + [0]
-        rc.append(struct.pack("<12fH", *data))
-    return b"".join(rc)
+    buf = bytearray(84 + 50 * len(ifacets))
+    _HEADER.pack_into(buf, 0, name.encode("utf-8"), len(ifacets))
+    pack = _FACET.pack_into
+    for offset, (a, b, c), ni in zip(range(84, len(buf), 50), ifacets, inormals):
+        pack(buf, offset, *vectors[ni], *points[a], *points[b], *points[c], 0)
+    if out is not None:
+        # Writing the buffer directly saves making a copy of it.
+        out.write(buf)
+        return None
+    return bytes(buf)
 
 
 def _test(args):
@@ -4,15 +4,20 @@
 # Copyright © 2013-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2013-07-07 21:01:52  +0200
-# Last modified: 2020-10-04T16:50:53+0200
+# Last modified: 2026-10-16T19:30:48+0200
 """Utilities for stltools."""
 
 import argparse
-import functools as ft
-import itertools as it
 import os.path
 import re
 
+# Leading whitespace and dots, and trailing whitespace.
+_STRIP_RE = re.compile(r"^[\s\.]+|\s+$")
+# Runs of whitespace.
+_WS_RE = re.compile(r"\s+")
+# Color components scaled to the range 0−1.
+_INV255 = tuple(j / 255 for j in range(256))
+
 
 class RotateAction(argparse.Action):
     """Gather rotation options."""
@@ -45,8 +50,8 @@ def outname(inname, extension, addenum=""):
         Output file name.
     """
     rv = os.path.splitext(os.path.basename(inname))[0]
-    rv = re.sub("^[\s\.]+|\s+$", "", rv)
-    rv = re.sub("\s+", "_", rv)
+    rv = _STRIP_RE.sub("", rv)
+    rv = _WS_RE.sub("_", rv)
     if not extension.startswith("."):
         extension = "." + extension
     return rv + addenum + extension
@@ -68,21 +73,21 @@ def num2rgb(color):
         color = 0xFFFFFF
     elif color < 0:
         color = 0
-    red = ((color & 0xFF0000) >> 16) / 255
-    green = ((color & 0x00FF00) >> 8) / 255
-    blue = (color & 0x0000FF) / 255
-    return red, green, blue
+    return _INV255[color >> 16], _INV255[(color >> 8) & 0xFF], _INV255[color & 0xFF]
 
 
-def chunked(iterable, n):
+def grouped(iterable, n):
     """
-    Split an iterable up in chunks of length n.
+    Group the items of an iterable in tuples of length n.
 
-    The second argument to the outer ``iter()`` is crucial to the way this works.
-    See the documentation for ``iter()`` for details.
-    """
+    This zips n references to the same iterator, so the grouping is done in
+    C. Items at the end that do not fill a whole tuple are dropped.
 
-    def take(n, iterable):
-        return list(it.islice(iterable, n))
+    Arguments:
+        iterable: The items to group.
+        n: The number of items per tuple.
 
-    return iter(ft.partial(take, n, iter(iterable)), [])
+    Returns:
+        An iterator of n-tuples.
+    """
+    return zip(*[iter(iterable)] * n)
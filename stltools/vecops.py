@@ -4,7 +4,7 @@
 # Copyright © 2013-2020 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2013-06-10 22:41:00 +0200
-# Last modified: 2020-10-04T17:41:39+0200
+# Last modified: 2026-10-16T20:05:12+0200
 """Operations on two or three dimensional vectors."""
 
 
@@ -18,6 +18,9 @@ def length(v):
     Returns:
         The length of the vector.
     """
+    if len(v) == 3:
+        x, y, z = v
+        return (x * x + y * y + z * z) ** 0.5
     return sum(j * j for j in v) ** 0.5
 
 
@@ -31,19 +34,19 @@ def normalize(v):
     Returns:
         The scaled array.
     """
+    if len(v) == 3:
+        x, y, z = v
+        ln = (x * x + y * y + z * z) ** 0.5
+        return (x / ln, y / ln, z / ln)
     ln = length(v)
     return tuple(j / ln for j in v)
 
 
 def cross(u, v):
     """Create the cross-product of two 3-tuples u and v."""
-    return tuple(
-        [
-            u[1] * v[2] - u[2] * v[1],
-            u[2] * v[0] - u[0] * v[2],
-            u[0] * v[1] - u[1] * v[0],
-        ]
-    )
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
 
 
 def normal(a, b, c):
@@ -56,14 +59,46 @@ def normal(a, b, c):
     Returns:
         A 3-tuple normal to the plane formed by a, b and c.
     """
-    u = tuple(j - k for j, k in zip(b, a))
-    v = tuple(j - k for j, k in zip(c, b))
-    # cross product
-    n = cross(u, v)
-    try:
-        return normalize(n)
-    except ZeroDivisionError:
-        return n
+    # This is cross and normalize written out, to avoid creating intermediate
+    # tuples and generators.
+    ax, ay, az = a
+    bx, by, bz = b
+    cx, cy, cz = c
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - bx, cy - by, cz - bz
+    nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+    ln2 = nx * nx + ny * ny + nz * nz
+    if ln2 == 0:
+        return (nx, ny, nz)
+    ln = ln2 ** 0.5
+    return (nx / ln, ny / ln, nz / ln)
+
+
+def normals(facets):
+    """
+    Calculate the normal vectors for a sequence of triangles.
+
+    This gives the same results as calling normal for every triangle, but
+    without the overhead of a function call per triangle.
+
+    Arguments:
+        facets: A sequence of triangles, each given as three 3-tuples of
+            numbers.
+
+    Returns:
+        A list of 3-tuples normal to the triangles.
+    """
+    rv = []
+    for (ax, ay, az), (bx, by, bz), (cx, cy, cz) in facets:
+        ux, uy, uz = bx - ax, by - ay, bz - az
+        vx, vy, vz = cx - bx, cy - by, cz - bz
+        nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+        ln2 = nx * nx + ny * ny + nz * nz
+        if ln2:
+            ln = ln2 ** 0.5
+            nx, ny, nz = nx / ln, ny / ln, nz / ln
+        rv.append((nx, ny, nz))
+    return rv
 
 
 def indexate(points):
@@ -77,9 +112,11 @@ def indexate(points):
         An array of indices and a sequence of unique 3-tuples.
     """
     pd = {}
-    indices = tuple(pd.setdefault(tuple(p), len(pd)) for p in points)
-    pt = sorted([(v, k) for k, v in pd.items()], key=lambda x: x[0])
-    unique = tuple(i[1] for i in pt)
+    setdefault = pd.setdefault
+    indices = tuple(setdefault(tuple(p), len(pd)) for p in points)
+    # Dictionaries preserve insertion order, so the keys are already sorted
+    # by their index. No need to build and sort a list of (index, point) pairs.
+    unique = tuple(pd)
     return indices, unique
 
 
@@ -93,7 +130,7 @@ def to4(pnts):
     Returns:
         A list of 4-tuples (x,y,z,1)
     """
-    return tuple((p[0], p[1], p[2], 1) for p in pnts)
+    return [(x, y, z, 1) for x, y, z in pnts]
 
 
 def to3(pnts):
@@ -108,7 +145,7 @@ def to3(pnts):
     Returns:
         A list of 3-tuples (x,y,z)
     """
-    return [(p[0] / p[3], p[1] / p[3], p[2] / p[3]) for p in pnts]
+    return [(x / w, y / w, z / w) for x, y, z, w in pnts]
 
 
 def xform(mat, pnts):
@@ -122,16 +159,62 @@ def xform(mat, pnts):
     Returns:
         The transformed list of tuples.
     """
-    mp = pnts
-    r = len(mat[0])
-    if r != len(pnts[0]):
-        mp = to4(pnts)
-    rv = []
-    for p in mp:
-        newp = []
-        for j in range(4):
-            newp.append(sum(i * k for i, k in zip(mat[j], p)))
-        rv.append(tuple(newp))
-    if len(pnts[0]) != len(rv[0]):
-        return to3(rv)
-    return rv
+    if len(mat) == 3:
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = mat
+        return [
+            (
+                m00 * x + m01 * y + m02 * z,
+                m10 * x + m11 * y + m12 * z,
+                m20 * x + m21 * y + m22 * z,
+            )
+            for x, y, z in pnts
+        ]
+    # Unpacking the matrix into local variables and writing out the products
+    # is much faster than looping over the rows and columns.
+    (
+        (m00, m01, m02, m03),
+        (m10, m11, m12, m13),
+        (m20, m21, m22, m23),
+        (m30, m31, m32, m33),
+    ) = mat
+    if len(pnts[0]) == 3 and (m30, m31, m32, m33) == (0, 0, 0, 1):
+        # For an affine transform of 3D points w is always 1, so the
+        # homogeneous coordinates and the division by w can be skipped.
+        rows = ((m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23))
+        if all(type(c) in (int, float) for r in rows for c in r):
+            # The division by w made the results floats, also for int
+            # matrices and points. Float matrix elements keep it that way.
+            (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23) = (
+                map(float, r) for r in rows
+            )
+        return [
+            (
+                m00 * x + m01 * y + m02 * z + m03,
+                m10 * x + m11 * y + m12 * z + m13,
+                m20 * x + m21 * y + m22 * z + m23,
+            )
+            for x, y, z in pnts
+        ]
+    if len(pnts[0]) == 3:
+        # Use w = 1 directly instead of building homogeneous coordinates,
+        # and scale the result back to 3D in the same loop.
+        rv = []
+        for x, y, z in pnts:
+            w = m30 * x + m31 * y + m32 * z + m33
+            rv.append(
+                (
+                    (m00 * x + m01 * y + m02 * z + m03) / w,
+                    (m10 * x + m11 * y + m12 * z + m13) / w,
+                    (m20 * x + m21 * y + m22 * z + m23) / w,
+                )
+            )
+        return rv
+    return [
+        (
+            m00 * x + m01 * y + m02 * z + m03 * w,
+            m10 * x + m11 * y + m12 * z + m13 * w,
+            m20 * x + m21 * y + m22 * z + m23 * w,
+            m30 * x + m31 * y + m32 * z + m33 * w,
+        )
+        for x, y, z, w in pnts
+    ]
@@ -3,7 +3,7 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2015-04-06 23:26:45 +0200
-# Last modified: 2020-10-03T23:42:41+0200
+# Last modified: 2026-10-16T20:14:41+0200
 """
 Tests for the matrix module.
 
@@ -11,6 +11,8 @@ Run this test only with py.test-3.5 -v test_matrix.py
 Run all tests with: py.test-3.5 -v test_*
 """
 
+import math
+
 import stltools.vecops as vo
 import stltools.matrix as ma
 
@@ -84,3 +86,68 @@ def test_xform_rotz():
     s = vo.xform(m, r)
     t = vo.xform(m, s)
     assert all(all(p - q < 0.001 for p, q in zip(i, j)) for i, j in zip(t, pnts))
+
+
+def test_xform_identity():
+    # The identity gives the same results as the full matrix product.
+    r = vo.xform(ma.I(), [(-0.0, 1.0, 2.0), (1, 2, 3)])
+    assert r == [(0.0, 1.0, 2.0), (1.0, 2.0, 3.0)]
+    assert math.copysign(1, r[0][0]) == 1
+    assert all(type(c) is float for c in r[1])
+
+
+def test_xform_affine_values():
+    # Every term is evaluated, so signed zeros and non-finite elements give
+    # the same results as the full matrix product.
+    r = vo.xform(ma.scale(-1, 1, 1), [(0.0, 1.0, 2.0)])
+    assert math.copysign(1, r[0][0]) == 1
+    r = vo.xform(ma.scale(float('inf'), 1, 1), [(1.0, 2.0, 3.0), (0.0, 1.0, 2.0)])
+    assert r[0] == (float('inf'), 2.0, 3.0) and math.isnan(r[1][0])
+    r = vo.xform(ma.trans([float('nan'), 0, 0]), [(1.0, 2.0, 3.0)])
+    assert math.isnan(r[0][0]) and r[0][1:] == (2.0, 3.0)
+    # Like the division by w, the affine transform returns floats.
+    r = vo.xform(ma.trans([1, 2, 3]), [(1, 2, 3)])
+    assert r == [(2.0, 4.0, 6.0)] and all(type(c) is float for c in r[0])
+
+
+def test_xform_3x3():
+    # A 3×3 matrix is applied without homogeneous coordinates.
+    m = [row[:3] for row in ma.rotz(90)[:3]]
+    pnts = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (1.0, 1.0, 5.0)]
+    r = vo.xform(m, pnts)
+    q = [(0.0, 1.0, 0.0), (-1.0, 0.0, 0.0), (-1.0, 1.0, 5.0)]
+    assert all(all(abs(a - b) < 1e-9 for a, b in zip(i, j)) for i, j in zip(r, q))
+
+
+def test_xform_perspective():
+    # The perspective matrix is not affine, so the result has to be divided
+    # by the w coordinate.
+    m = ma.perspective(60, 200, 100, 1, 100)
+    pnts = [(1.0, 2.0, -3.0), (-4.0, 5.0, -6.0)]
+    r = vo.xform(m, pnts)
+    for p, q in zip(pnts, r):
+        h = [sum(a * b for a, b in zip(row, p + (1,))) for row in m]
+        e = [c / h[3] for c in h[:3]]
+        assert all(abs(a - b) < 1e-9 for a, b in zip(q, e))
+
+
+def test_dot():
+    m = ma.concat(ma.rotx(30), ma.trans([1, 2, 3]))
+    assert ma.dot(ma.I(), m) == m
+    assert ma.dot(m, ma.I()) == m
+    # Two rotations around the same axis add up.
+    r = ma.dot(ma.rotx(20), ma.rotx(50))
+    q = ma.rotx(70)
+    assert all(all(abs(a - b) < 1e-12 for a, b in zip(i, j)) for i, j in zip(r, q))
+
+
+def test_mul():
+    m = ma.rotx(120)
+    pnts = [(0.0, 1.0, 2.0), (3.0, 4.0, 5.0), (6.0, 7.0, 8.0)]
+    # Transforming once with the product equals transforming three times.
+    r = vo.xform(ma.mul(m, m, m), pnts)
+    q = vo.xform(m, vo.xform(m, vo.xform(m, pnts)))
+    assert all(all(abs(a - b) < 1e-9 for a, b in zip(i, j)) for i, j in zip(r, q))
+    assert all(all(abs(a - b) < 1e-9 for a, b in zip(i, j)) for i, j in zip(r, pnts))
+    t = ma.trans([1, 2, 3])
+    assert ma.mul(m, t) == ma.concat(t, m)
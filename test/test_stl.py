@@ -3,7 +3,7 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2015-08-22 16:45:36 +0200
-# Last modified: 2020-10-04T14:31:00+0200
+# Last modified: 2026-10-16T10:12:40+0200
 """
 Tests for the stl module.
 
@@ -11,6 +11,8 @@ Run this test only with py.test-v test_stl.py
 Run all tests with: py.test -v test_*
 """
 
+import io
+import pytest
 import stltools.stl as stl
 
 
@@ -58,3 +60,32 @@ def test_text():
         orig = [' '.join(ln.strip().split()) for ln in inp.readlines()]
     for a, b in zip(orig, res):
         assert a == b
+
+
+def test_toindexed():
+    vertices, _ = stl.readstl('test/data/cube-bin.stl')
+    facets, pnts = stl.toindexed(vertices)
+    assert len(facets) == 12
+    assert all(isinstance(f, tuple) and len(f) == 3 for f in facets)
+    assert all(pnts[i] == v for i, v in zip((i for f in facets for i in f), vertices))
+
+
+def test_binary():
+    origpath = 'test/data/cube-bin.stl'
+    vertices, name = stl.readstl(origpath)
+    facets, pnts = stl.toindexed(vertices)
+    ni, nv = stl.normals(facets, pnts)
+    res = stl.binary('cube_bin', facets, pnts, ni, nv)
+    with open(origpath, 'rb') as inp:
+        orig = inp.read()
+    assert res == orig[:len(res)]
+    buf = io.BytesIO()
+    assert stl.binary('cube_bin', facets, pnts, ni, nv, out=buf) is None
+    assert buf.getvalue() == res
+
+
+def test_read_invalid(tmp_path):
+    path = tmp_path / 'invalid.stl'
+    path.write_bytes(b'This is not an STL file.\n')
+    with pytest.raises(ValueError):
+        stl.readstl(str(path))
@@ -3,7 +3,7 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2015-08-22 20:18:04 +0200
-# Last modified: 2016-06-11 00:45:23 +0200
+# Last modified: 2026-10-16T19:30:48+0200
 """Tests for the utils module.
 
 Run this test only with py.test-3.5 -v test_utils.py
@@ -20,3 +20,18 @@ def test_outnames():
     assert utils.outname('.foo', 'bar') == 'foo.bar'
     assert utils.outname('foo ', 'bar') == 'foo.bar'
     assert utils.outname('/home/bla/foo ', 'bar') == 'foo.bar'
+    assert utils.outname(' .my  foo file.stl', '.eps') == 'my_foo_file.eps'
+
+
+def test_num2rgb():
+    assert utils.num2rgb(0xFFFFFF) == (1, 1, 1)
+    assert utils.num2rgb(0) == (0, 0, 0)
+    assert utils.num2rgb(0xFF0080) == (1, 0, 128 / 255)
+    # Out of range values are clamped.
+    assert utils.num2rgb(0x1000000) == (1, 1, 1)
+    assert utils.num2rgb(-1) == (0, 0, 0)
+
+
+def test_grouped():
+    assert list(utils.grouped([1, 2, 3, 4, 5, 6], 3)) == [(1, 2, 3), (4, 5, 6)]
+    assert list(utils.grouped(iter(range(5)), 2)) == [(0, 1), (2, 3)]
@@ -3,7 +3,7 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2015-04-06 23:26:45 +0200
-# Last modified: 2020-10-03T22:54:32+0200
+# Last modified: 2026-10-16T13:05:12+0200
 """
 Tests for the vecops module.
 
@@ -28,6 +28,10 @@ def test_vo_length():
     # (20**2+5**2+4**2)**0.5 == 21
     v = [20, 5, 4]
     assert vo.length(v) == 21
+    # Two dimensional vectors work as well.
+    assert vo.length([3, 4]) == 5
+    r = vo.normalize([3, 4])
+    assert all(abs(i - j) < 1e-12 for i, j in zip(r, [0.6, 0.8]))
 
 
 def test_vo_normalize():
@@ -41,6 +45,16 @@ def test_vo_normalize():
     assert all(i/j == 21 for i, j in zip(v, r))
 
 
+def test_vo_cross():
+    # The cross product of two unit vectors is the third unit vector.
+    assert vo.cross((1, 0, 0), (0, 1, 0)) == (0, 0, 1)
+    assert vo.cross((0, 1, 0), (0, 0, 1)) == (1, 0, 0)
+    assert vo.cross((0, 0, 1), (1, 0, 0)) == (0, 1, 0)
+    # Swapping the arguments reverses the direction.
+    assert vo.cross((0, 1, 0), (1, 0, 0)) == (0, 0, -1)
+    assert vo.cross([1, 2, 3], [4, 5, 6]) == (-3, 6, -3)
+
+
 def test_vo_normal():
     # The normal of a plane through the origin and two unit vectors should
     # be plus/minus other unit vector.
@@ -57,6 +71,17 @@ def test_vo_normal():
     assert all(i == j for i, j in zip(r, [c, c, c]))
 
 
+def test_vo_normals():
+    # The batch version should give the same results as normal.
+    tri = [
+        ([0, 0, 0], [1, 0, 0], [0, 1, 0]),
+        ([1, 0, 0], [0, 1, 0], [0, 0, 1]),
+        ([1, 2, 3], [-4, 5, 1], [0.5, -2, 7]),
+        ([1, 1, 1], [1, 1, 1], [1, 1, 1]),
+    ]
+    assert vo.normals(tri) == [vo.normal(a, b, c) for a, b, c in tri]
+
+
 def test_vo_indexate():
     # Create 5 unique points and then make a list of 10 point by concatenating
     # that twice. Indexing that should give the indexes 0, 1, 2, 3, 4 twice,